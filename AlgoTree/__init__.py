@@ -7,8 +7,8 @@ from .node_hasher import NodeHasher
 from .tree_hasher import TreeHasher
 from .treenode import TreeNode
 from .utils import (
-    map, visit, descendants, ancestors, siblings, leaves, height, depth,
-    is_root, is_leaf, is_internal,
+    map, visit, descendants, ancestors, is_ancestor, siblings, leaves, height,
+    depth, is_root, is_leaf, is_internal,
     breadth_first, find_nodes, find_node, find_path, node_stats, size, prune,
     lca, breadth_first_undirected, node_to_leaf_paths, distance,
     subtree_centered_at, subtree_rooted_at, paths_to_tree, is_isomorphic)
@@ -159,10 +159,15 @@ class FlatForest(dict):
         :return: List of names of the children of the node.
         """
 
-        if name not in self.node_names():
+        children = [k for k, v in self.items() if v.get(FlatForest.PARENT_KEY) == name]
+
+        # a name without an entry is still a (logical) node if some node
+        # names it as its parent, or if it is the detached root
+        if name not in self and name != FlatForest.DETACHED_KEY and (
+                name is None or not children):
             raise KeyError(f"Node name not found: {name!r}")
 
-        return [k for k, v in self.items() if v.get(FlatForest.PARENT_KEY) == name]
+        return children
     
     def detach(self, name: str) -> "FlatForestNode":
         """
@@ -206,14 +211,10 @@ class FlatForest(dict):
         if not isinstance(data, dict):
             raise ValueError(f"Data is not a dictionary: {data=}")
         
-        def _check_cycle(key, visited):
-            if key in visited:
-                raise ValueError(f"Cycle detected: {visited}")
-            visited.add(key)
-            par_key = data[key].get(FlatForest.PARENT_KEY, None)
-            if par_key is not None:
-                _check_cycle(par_key, visited)
-
+        # keys already known to lead up to a root (or to a node outside the
+        # forest, e.g. the detached root) without a cycle; a walk up the
+        # parent chain can stop as soon as it reaches one of them
+        acyclic = set()
         for key, value in data.items():
             if not isinstance(value, dict):
                 raise ValueError(
@@ -227,7 +228,14 @@ class FlatForest(dict):
                 raise KeyError(
                     f"Parent {par_key!r} not in forest for node {key!r}")
 
-            _check_cycle(key, set())
+            visited = set()
+            cur = key
+            while cur in data and cur not in acyclic:
+                if cur in visited:
+                    raise ValueError(f"Cycle detected: {visited}")
+                visited.add(cur)
+                cur = data[cur].get(FlatForest.PARENT_KEY, None)
+            acyclic.update(visited)
 
     def as_tree(self, root_name = "__ROOT__") -> "FlatForestNode":
         """
@@ -287,13 +295,15 @@ class FlatForest(dict):
         """
         Purge detached nodes (tree rooted at `FlatForest.DETACHED_KEY`).
         """
-        def _purge(node):
-            for child in node.children:
-                _purge(child)
-            del self[node.name]
-        
-        for child in self.detached.children:
-            _purge(child)
+        names = []
+        stack = self.detached.children
+        while stack:
+            node = stack.pop()
+            names.append(node.name)
+            stack.extend(node.children)
+
+        for name in names:
+            del self[name]
 
     @property
     def detached(self) -> "FlatForestNode":
@@ -44,10 +44,13 @@ class FlatForestNode(collections.abc.MutableMapping):
             new_node._forest[self._key] = deepcopy(self._forest[self._key])
             new_node._root_key = parent._root_key
 
-        if clone_children:
-            for child in self.children:
-                child.clone(parent=new_node, clone_children=True)
         new_node._key = self._key
+        if clone_children:
+            stack = [(child, new_node) for child in reversed(self.children)]
+            while stack:
+                child, par = stack.pop()
+                new_child = child.clone(parent=par)
+                stack.extend((c, new_child) for c in reversed(child.children))
         return new_node
 
     @staticmethod
@@ -240,9 +243,10 @@ class FlatForestNode(collections.abc.MutableMapping):
     def __getattr__(self, key) -> Any:
         if key in ["name", "parent", "root", "forest", "payload", "children"]:
             return object.__getattribute__(self, key)
-        if key in self:
-            return self[key]
-        return None
+        data = self._forest.get(self._key)
+        if data is None or key == FlatForest.PARENT_KEY:
+            return None
+        return data.get(key)
 
     def detach(self) -> "FlatForestNode":
         """
@@ -372,15 +376,29 @@ class FlatForestNode(collections.abc.MutableMapping):
     
     def contains(self, name) -> bool:
         """
-        Check if the the subtree rooted at the node contains any children
-        with the given name
+        Check if the the subtree rooted at the node contains a node
+        with the given name (including the node itself).
 
         :param key: The key to check.
-        :return: True if the child node is present, False otherwise.
+        :return: True if the node is present, False otherwise.
         """
 
-        from .utils import is_ancestor
-        return is_ancestor(self, self.node(name))
+        # walk up the parent keys from `name`; comparing keys avoids building
+        # proxy nodes, whose equality hashes the whole root path
+        if name == self._key:
+            return True
+        forest = self._forest
+        cur = name
+        while cur != self._root_key:
+            data = forest.get(cur)
+            if data is None:
+                return False
+            cur = data.get(FlatForest.PARENT_KEY, self._root_key)
+            if cur == self._key:
+                return True
+            if cur is None or cur == FlatForest.DETACHED_KEY:
+                return False
+        return False
         
     def __contains__(self, key) -> bool:
         """
@@ -67,48 +67,56 @@ class PrettyTree:
         style = self.style.copy()
         style.update(kwargs.get("style", {}))
 
-        marked_nodes = self.marked_nodes + kwargs.get("mark", [])
+        marked_nodes = frozenset(self.marked_nodes).union(kwargs.get("mark", []))
         node_name = kwargs.get("node_name", self.node_name)
         node_details = kwargs.get("node_details", self.node_details)
         indent = kwargs.get("indent", self.indent)
         markers = kwargs.get("markers", style['markers'])
 
-        def _build(cur, ind, bar_levels, is_last):
-            s = ""
-            if ind > 0:
-                for i in range(ind - 1):
-                    if i in bar_levels:
-                        s += style["vertical"]
-                    else:
-                        s += style["spacer"]
-                    s += style["spacer"] * (indent - 1)
-                if is_last:
-                    s += style["last_child_connector"]
-                else:
-                    s += style["child_connector"]
-                s += style["horizontal"] * (indent - 2)
-                s += style["spacer"] 
-
-            s += str(node_name(cur))
+        pad = style["spacer"] * (indent - 1)
+        bar_prefix = style["vertical"] + pad
+        blank_prefix = style["spacer"] + pad
+        stem = style["horizontal"] * (indent - 2) + style["spacer"]
+        connector = style["child_connector"] + stem
+        last_connector = style["last_child_connector"] + stem
+
+        # prefix holds one segment per ancestor below the root: a bar if the
+        # ancestor has later siblings, blank otherwise. A (None, None) entry
+        # on the stack marks the end of a subtree and pops its segment.
+        parts = []
+        prefix = []
+        stack = [(node, None)]
+        while stack:
+            cur, is_last = stack.pop()
+            if cur is None:
+                prefix.pop()
+                continue
+
+            if is_last is not None:
+                parts.extend(prefix)
+                parts.append(last_connector if is_last else connector)
+
+            parts.append(str(node_name(cur)))
             if node_details is not None:
-                s += style["spacer"]
-                s += style["payload_connector"]
-                s += style["spacer"]
-                s += str(node_details(cur))
+                parts.append(style["spacer"])
+                parts.append(style["payload_connector"])
+                parts.append(style["spacer"])
+                parts.append(str(node_details(cur)))
             if cur.name in marked_nodes:
-                s += style["spacer"]
-                s += PrettyTree.mark(str(node_name(cur)), markers)
-            s += "\n"
-
-            for i, child in enumerate(cur.children):
-                new_bar_levels = bar_levels.copy()
-                if i < len(cur.children) - 1:
-                    new_bar_levels.add(ind)
-                s += _build(child, ind + 1, new_bar_levels, i == len(cur.children) - 1)
-
-            return s
-
-        return _build(node, 0, set(), True)
+                parts.append(style["spacer"])
+                parts.append(PrettyTree.mark(str(node_name(cur)), markers))
+            parts.append("\n")
+
+            children = cur.children
+            if children:
+                if is_last is not None:
+                    stack.append((None, None))
+                    prefix.append(blank_prefix if is_last else bar_prefix)
+                last = len(children) - 1
+                for i in range(last, -1, -1):
+                    stack.append((children[i], i == last))
+
+        return "".join(parts)
 
 
 def pretty_tree(node, **kwargs) -> str:
@@ -56,14 +56,18 @@ class TreeConverter:
 
         node_type = type(under)
         tries: int = 0
-        def build(cur, und):
-            nonlocal tries
+        root = None
+        # nodes are created in pre-order, so children are attached to their
+        # new parent in their original order
+        stack = [(node, under)]
+        while stack:
+            cur, und = stack.pop()
             data = deepcopy(extract(cur))
             name = node_name(cur)
             base_name = name
             while tries <= max_tries:
                 try:
-                    node = node_type(name=name, parent=und, payload=data)
+                    new_node = node_type(name=name, parent=und, payload=data)
                     break
                 except Exception as e:
                     name = f"{base_name}_{tries}"
@@ -72,11 +76,11 @@ class TreeConverter:
                 if tries >= max_tries:
                     raise ValueError("Max tries exceeded")
 
-            for child in cur.children:
-                build(child, node)
-            return node
+            if root is None:
+                root = new_node
+            stack.extend((child, new_node) for child in reversed(cur.children))
 
-        return build(node, under)
+        return root
 
     @staticmethod
     def convert(
@@ -123,12 +127,20 @@ class TreeConverter:
         :return: A dictionary representation of the subtree.
         """
 
-        def _build(node):
-            return {
-                "name": node_name(node),
-                "payload": extract(node, **kwargs),
-                "children": [_build(child, **kwargs) for child in node.children]
+        root_dict = None
+        stack = [(node, None)]
+        while stack:
+            cur, siblings = stack.pop()
+            node_dict = {
+                "name": node_name(cur),
+                "payload": extract(cur, **kwargs),
+                "children": []
             }
-        
-        return _build(node)
-
+            if siblings is None:
+                root_dict = node_dict
+            else:
+                siblings.append(node_dict)
+            stack.extend((child, node_dict["children"])
+                         for child in reversed(cur.children))
+
+        return root_dict
@@ -27,24 +27,60 @@ class TreeHasher:
     @staticmethod
     def tree(tree: Any) -> int:
         """
-        Hash based on the entire tree structure.
+        Hash based on the entire tree structure, including node names and
+        payloads.
 
         :param tree: The tree to hash.
         :return: The hash value for the tree.
         """
         if tree is None:
             raise ValueError("Tree cannot be None")
-        
-        return hash(str(TreeConverter.to_dict(tree)))
+
+        name = TreeConverter.default_node_name
+        extract = TreeConverter.default_extract
+        return TreeHasher._post_order(
+            tree,
+            lambda node, child_hashes: hash(
+                (name(node), repr(extract(node)), child_hashes)))
 
     @staticmethod
     def isomorphic(tree: Any) -> int:
-        """Hash based on tree structure only, ignoring node names and payloads."""
+        """
+        Hash based on tree structure only, ignoring node names and payloads.
+        The order of the children does not matter.
+
+        :param tree: The tree to hash.
+        :return: The hash value for the tree.
+        """
         if tree is None:
             raise ValueError("Tree cannot be None")
 
-        def build(node):            
-            child_nums = [TreeHasher.isomorphic(child) for child in tree.children]
-            return [len(node.children), child_nums]
+        return TreeHasher._post_order(
+            tree,
+            lambda node, child_hashes: hash(tuple(sorted(child_hashes))))
 
-        return build(tree)
+    @staticmethod
+    def _post_order(tree: Any, node_hash) -> int:
+        """
+        Hash a tree bottom-up with an iterative post-order walk, so that
+        deep trees do not hit the recursion limit.
+
+        :param tree: The tree to hash.
+        :param node_hash: Function that maps a node and the tuple of its
+                          children's hashes to the hash of the node.
+        :return: The hash value for the tree.
+        """
+        hashes = []
+        stack = [(tree, None)]
+        while stack:
+            node, n = stack.pop()
+            if n is None:
+                children = node.children
+                stack.append((node, len(children)))
+                stack.extend((child, None) for child in reversed(children))
+            else:
+                i = len(hashes) - n
+                child_hashes = tuple(hashes[i:])
+                del hashes[i:]
+                hashes.append(node_hash(node, child_hashes))
+        return hashes[0]
@@ -1,5 +1,7 @@
+from collections import deque
 from typing import Dict, List, Optional, Any
 import copy
+import sys
 import uuid
 
 class TreeNode(dict):
@@ -10,6 +12,8 @@ class TreeNode(dict):
     attribute.
     """
 
+    __slots__ = ("name", "children", "_parent", "payload", "__weakref__")
+
     @staticmethod
     def from_dict(data: Dict) -> "TreeNode":
         """
@@ -19,19 +23,25 @@ class TreeNode(dict):
         :return: A TreeNode object.
         """
 
-        def _from_dict(data, parent):
+        # copy one level at a time, so deep documents are not copied
+        # recursively and the caller's dictionaries are never mutated
+        root = None
+        q = deque([(data, None)])
+        while q:
+            node_data, parent = q.popleft()
+            node_data = dict(node_data)
             node = TreeNode(parent=parent, payload=None,
-                            name=data.pop("name", None))
-            node.payload = data.pop("payload", {})
-            for k, v in data.items():
+                            name=node_data.pop("name", None))
+            node.payload = copy.deepcopy(node_data.pop("payload", {}))
+            for k, v in node_data.items():
                 if k == "children":
-                    for child in v:
-                        _from_dict(child, node)
+                    q.extend((child, node) for child in v)
                 else:
-                    node.payload[k] = v
-            return node
+                    node.payload[k] = copy.deepcopy(v)
+            if root is None:
+                root = node
         
-        return _from_dict(copy.deepcopy(data), None)
+        return root
 
     def clone(self) -> "TreeNode":
         """
@@ -39,15 +49,18 @@ class TreeNode(dict):
 
         :return: A new TreeNode object with the same data as the current node.
         """
-        def _clone(node, parent):
+        root = None
+        stack = [(self, None)]
+        while stack:
+            node, parent = stack.pop()
             new_node = TreeNode(parent=parent,
                                 name=node.name,
                                 payload=copy.deepcopy(node.payload))
-            for child in node.children:
-                _clone(child, new_node)
-            return new_node
-        
-        return _clone(self, None)
+            if parent is None:
+                root = new_node
+            stack.extend((child, new_node) for child in reversed(node.children))
+
+        return root
 
     def __init__(
         self,
@@ -71,13 +84,19 @@ class TreeNode(dict):
         """
         if name is None:
             name = str(uuid.uuid4())
+        elif type(name) is str:
+            # sys.intern only accepts exact str, not subclasses
+            name = sys.intern(name)
         self.name = name
 
+        # a new node has no old parent to detach from, so attach it directly
+        # instead of going through the `parent` setter
         if parent is not None and not isinstance(parent, TreeNode):
             raise ValueError("Parent must be a TreeNode object")
         self.children = []
-        self._parent = None
-        self.parent = parent
+        self._parent = parent
+        if parent is not None:
+            parent.children.append(self)
 
         if payload is not None:
             self.payload = payload
@@ -135,10 +154,14 @@ class TreeNode(dict):
 
         :return: A list of all the nodes in the current sub-tree.
         """
+        # reversed pre-order (children pushed left to right) is post-order
         nodes = []
-        for child in self.children:
-            nodes.extend(child.nodes())
-        nodes.append(self)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children)
+        nodes.reverse()
         return nodes
     
     def subtree(self, name: str) -> "TreeNode":
@@ -167,31 +190,37 @@ class TreeNode(dict):
         :return: The node with the given name.
         """
 
-        def _descend(node, name):
+        node = self
+        while node is not None:
             if node.name == name:
                 return node
-            for child in node.children:
-                result = _descend(child, name)
-                if result is not None:
-                    return result
-            return None
-        
-        def _ascend(node, name):
+            node = node.parent
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
             if node.name == name:
                 return node
-            if node.parent is not None:
-                return _ascend(node.parent, name)
-            return None
-        
-        asc_node = _ascend(self, name)
-        if asc_node is not None:
-            return asc_node
-        dsc_node =_descend(self, name)
-        if dsc_node is not None:
-            return dsc_node
+            stack.extend(reversed(node.children))
         
         raise KeyError(f"Node with name {name} not found")
 
+    def contains(self, name: str) -> bool:
+        """
+        Check if the sub-tree rooted at the current node contains a node with
+        the given name. The search stops at the first match.
+
+        :param name: The name of the node.
+        :return: True if a node with the given name is found, False otherwise.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.name == name:
+                return True
+            stack.extend(node.children)
+        return False
+
     def add_child(self, name: Optional[str] = None,
                   payload: Optional[Any] = None,
                   *args, **kwargs) -> "TreeNode":
@@ -221,15 +250,16 @@ class TreeNode(dict):
         :param data: The data to check.
         :return: True if the data is a valid TreeNode, False otherwise.
         """
-        if not isinstance(data, dict):
-            return False
-        if "children" in data:
-            if not isinstance(data["children"], list):
+        stack = [data]
+        while stack:
+            cur = stack.pop()
+            if not isinstance(cur, dict):
                 return False
-            for child in data["children"]:
-                if not TreeNode.is_valid(child):
+            if "children" in cur:
+                if not isinstance(cur["children"], list):
                     return False
-        
+                stack.extend(cur["children"])
+
         return True
     
     def to_dict(self):
@@ -238,14 +268,22 @@ class TreeNode(dict):
 
         :return: A dictionary representation of the subtree.
         """
-        def _convert(node):
+        root_dict = None
+        stack = [(self, None)]
+        while stack:
+            node, siblings = stack.pop()
             node_dict = {}
             node_dict["name"] = node.name
             node_dict["payload"] = node.payload
-            node_dict["children"] = [_convert(child) for child in node.children]
-            return node_dict
-
-        return _convert(self)
+            node_dict["children"] = []
+            if siblings is None:
+                root_dict = node_dict
+            else:
+                siblings.append(node_dict)
+            stack.extend((child, node_dict["children"])
+                         for child in reversed(node.children))
+
+        return root_dict
     
     def __eq__(self, other) -> bool:
         """
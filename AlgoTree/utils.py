@@ -50,8 +50,9 @@ def visit(node: Any,
         return breadth_first(node, func, **kwargs)
 
     s = deque([(node, 0)])
+    pop, push = s.pop, s.append
     while s:
-        node, depth = s.pop()
+        node, depth = pop()
         if max_hops < depth:
             continue
 
@@ -59,7 +60,9 @@ def visit(node: Any,
             if func(node, **kwargs):
                 return True
 
-        s.extend([(c, depth + 1) for c in reversed(node.children)])
+        children = node.children
+        for i in range(len(children) - 1, -1, -1):
+            push((children[i], depth + 1))
         if order == "post":
             if func(node, **kwargs):
                 return True
@@ -110,20 +113,38 @@ def map(node: Any,
     if not hasattr(node, "children"):
         raise AttributeError("node must have a 'children' property")
 
-    if order == "pre":
-        node = func(node, **kwargs)
-
-    if node is None:
-        return None
+    # A frame is (node, out, children, new_children). On entry `children` is
+    # None; on exit the mapped node is appended to its parent's `out` list
+    # (unless it maps to None).
+    result = []
+    stack = [(node, result, None, None)]
+    while stack:
+        cur, out, children, new_children = stack.pop()
+        if children is None:
+            if order == "pre":
+                cur = func(cur, **kwargs)
+                if cur is None:
+                    continue
+
+            children = cur.children if hasattr(cur, "children") else []
+            new_children = []
+            stack.append((cur, out, children, new_children))
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], new_children, None, None))
+            continue
 
-    if hasattr(node, "children"):
-        node.children = [c for c in [map(c, func, order, **kwargs) for c in
-                         node.children] if c is not None]
+        # only reassign if something changed; for some node types (e.g.,
+        # `FlatForestNode`), assigning children detaches and re-attaches them
+        if (len(new_children) != len(children) or
+                any(n is not c for n, c in zip(new_children, children))):
+            cur.children = new_children
 
-    if order == "post":
-        node = func(node, **kwargs)
+        if order == "post":
+            cur = func(cur, **kwargs)
+        if cur is not None:
+            out.append(cur)
 
-    return node
+    return result[0] if result else None
 
 
 def descendants(node) -> List:
@@ -137,8 +158,12 @@ def descendants(node) -> List:
         raise ValueError("Node must not be None")
 
     results = []
-    visit(node, lambda n: results.append(n) or False, order="pre")
-    return results[1:]
+    stack = list(reversed(node.children))
+    while stack:
+        cur = stack.pop()
+        results.append(cur)
+        stack.extend(reversed(cur.children))
+    return results
 
 
 def siblings(node) -> List:
@@ -169,11 +194,14 @@ def leaves(node) -> List:
         raise ValueError("Node must not be None")
 
     results = []
-    visit(
-        node,
-        lambda n: results.append(n) or False if not n.children else False,
-        order="post",
-    )
+    stack = [node]
+    while stack:
+        cur = stack.pop()
+        children = cur.children
+        if children:
+            stack.extend(reversed(children))
+        else:
+            results.append(cur)
     return results
 
 
@@ -188,10 +216,16 @@ def height(node) -> int:
     if node is None:
         raise ValueError("Node must not be None")
 
-    def _height(n):
-        return 0 if is_leaf(n) else 1 + max(_height(c) for c in n.children)
-    
-    return _height(node)
+    h = 0
+    stack = [(node, 0)]
+    while stack:
+        cur, d = stack.pop()
+        children = cur.children
+        if children:
+            stack.extend((c, d + 1) for c in children)
+        elif d > h:
+            h = d
+    return h
 
 
 def depth(node) -> int:
@@ -204,7 +238,11 @@ def depth(node) -> int:
     if node is None:
         raise ValueError("Node must not be None")
 
-    return 0 if is_root(node) else 1 + depth(node.parent)
+    d = 0
+    while node.parent is not None:
+        node = node.parent
+        d += 1
+    return d
 
 
 def is_root(node) -> bool:
@@ -287,17 +325,17 @@ def breadth_first(node: Any,
         raise AttributeError("node must have a 'children' property")
 
     q: Deque[Tuple[Any, int]] = deque([(node, 0)])
+    popleft, push = q.popleft, q.append
     while q:
-        cur, lvl = q.popleft()
-        if max_lvl is not None and lvl > max_lvl:
-            continue
-
+        cur, lvl = popleft()
         kwargs["level"] = lvl
         if func(cur, **kwargs):
             return True
 
-        for child in cur.children:
-            q.append((child, lvl + 1))
+        # children past `max_lvl` would only be dequeued and skipped
+        if max_lvl is None or lvl < max_lvl:
+            for child in cur.children:
+                push((child, lvl + 1))
     return False
 
 def breadth_first_undirected(node, max_hops = float("inf")):
@@ -311,13 +349,13 @@ def breadth_first_undirected(node, max_hops = float("inf")):
 
     within_hops = []
     q : Deque[Tuple[Any, int]] = deque([(node, 0)])
-    visited = []
+    visited = set()
     while q:
         cur, depth = q.popleft()
         if depth > max_hops:
             continue
-        if cur not in visited:            
-            visited.append(cur)
+        if cur not in visited:
+            visited.add(cur)
             within_hops.append(cur)
             for child in cur.children:
                 q.append((child, depth + 1))
@@ -422,14 +460,16 @@ def node_to_leaf_paths(node: Any) -> List:
     """
 
     paths = []
-    def _find_paths(n, path):
-        if is_leaf(n):
-            paths.append(path + [n])
+    stack = [(node, [])]
+    while stack:
+        n, prefix = stack.pop()
+        path = prefix + [n]
+        children = n.children
+        if children:
+            # siblings share (and never mutate) the same prefix list
+            stack.extend((c, path) for c in reversed(children))
         else:
-            for c in n.children:
-                _find_paths(c, path + [n])
-
-    _find_paths(node, [])
+            paths.append(path)
     return paths
 
 def find_path(source: Any, dest: Any, bidirectional: bool = False) -> List:
@@ -443,19 +483,22 @@ def find_path(source: Any, dest: Any, bidirectional: bool = False) -> List:
     if source is None or dest is None:
         raise ValueError("Source and destination nodes must not be None")
 
-    def _find(n, p, dst):
-        p.append(n)
-        if n == dst:
-            # return the reversed path
-            return p[::-1]
-        elif is_root(n):
-            return None
-        else:
-            return _find(n.parent, p, dst)
-
-    found_path = _find(dest, [], source)
+    def _find(n, dst):
+        # compare with `==`: TreeNode overrides __eq__ but inherits
+        # dict.__ne__
+        p = [n]
+        while True:
+            if n == dst:
+                # return the reversed path
+                return p[::-1]
+            if is_root(n):
+                return None
+            n = n.parent
+            p.append(n)
+
+    found_path = _find(dest, source)
     if found_path is None and bidirectional:
-        found_path = _find(source, [], dest)
+        found_path = _find(source, dest)
     return found_path
     
 
@@ -475,15 +518,31 @@ def ancestors(node) -> List:
     :return: List of ancestor nodes.
     """
     anc = []
-    def _ancestors(n):
-        nonlocal anc
-        if not is_root(n):
-            anc.append(n.parent)
-            _ancestors(n.parent)
-
-    _ancestors(node)
+    cur = node.parent
+    while cur is not None:
+        anc.append(cur)
+        cur = cur.parent
     return anc
 
+def is_ancestor(node: Any, other: Any) -> bool:
+    """
+    Check if `node` is a (proper) ancestor of `other`. We walk up the parent
+    chain of `other` and stop as soon as we reach `node` or a root.
+
+    :param node: The candidate ancestor.
+    :param other: The node whose ancestors are checked.
+    :return: True if `node` is an ancestor of `other`, False otherwise.
+    """
+    if node is None or other is None:
+        raise ValueError("Nodes must not be None")
+
+    cur = other.parent
+    while cur is not None:
+        if cur is node or cur == node:
+            return True
+        cur = cur.parent
+    return False
+
 def path(node: Any) -> List:
     """
     Get the path from the root node to the given node.
@@ -491,8 +550,7 @@ def path(node: Any) -> List:
     :param node: The node.
     :return: The path from the root node to the given node.
     """
-    anc = ancestors(node)
-    return [node] + anc[::-1]
+    return [node] + ancestors(node)[::-1]
 
 def size(node: Any) -> int:
     """
@@ -501,7 +559,15 @@ def size(node: Any) -> int:
     :param node: The node.
     :return: The number of descendents of the node.
     """
-    return len(descendants(node)) + 1
+    if node is None:
+        raise ValueError("Node must not be None")
+
+    count = 0
+    stack = [node]
+    while stack:
+        count += 1
+        stack.extend(stack.pop().children)
+    return count
 
 def lca(node1, node2, hash_fn=None) -> Any:
     """
@@ -556,21 +622,12 @@ def subtree_rooted_at(node: Any, max_lvl: int) -> Any:
     :return: The subtree centered at the node.
     """
     
-    within_hops = []
+    within_hops = set()
     def _helper(node, **kwargs):
-        within_hops.append(node)
+        within_hops.add(node)
         return False
     breadth_first(node, _helper, max_lvl)
-
-    def _build(n, par):
-        #new_node = type(n)(name=n.name, payload=n.payload, parent=par)
-        new_node = n.clone(par)
-        for c in n.children:
-            if c in within_hops:
-                _build(c, new_node)
-        return new_node
-    
-    return _build(node, None)
+    return _clone_within(node, within_hops)
 
 
 def subtree_centered_at(node: Any, max_hops: int) -> Any:
@@ -584,21 +641,30 @@ def subtree_centered_at(node: Any, max_hops: int) -> Any:
     :return: The subtree centered at the node.
     """
     
-    within_hops = breadth_first_undirected(node, max_hops)
+    within_hops = set(breadth_first_undirected(node, max_hops))
     root = node
-    while root.parent is not None:
-        if root.parent in within_hops:
-            root = root.parent
+    while root.parent is not None and root.parent in within_hops:
+        root = root.parent
+    return _clone_within(root, within_hops)
+
+def _clone_within(root: Any, within: set) -> Any:
+    """
+    Clone the part of the subtree rooted at `root` that is reachable through
+    nodes in `within`.
 
-    def _build(n, par):
-        new_node = n.clone(par)
-        #new_node = type(n)(name=n.name, payload=n.payload, parent=par)
+    :param root: The root node of the subtree to clone.
+    :param within: The nodes to keep. Children not in `within` are skipped,
+                   along with their descendants.
+    :return: The root of the cloned subtree.
+    """
+    new_root = root.clone(None)
+    stack = [(root, new_root)]
+    while stack:
+        n, new_node = stack.pop()
         for c in n.children:
-            if c in within_hops:
-                _build(c, new_node)
-        return new_node
-    
-    return _build(root, None)
+            if c in within:
+                stack.append((c, c.clone(new_node)))
+    return new_root
 
 def average_distance(node: Any) -> float:
     """
@@ -692,15 +758,15 @@ def paths_to_tree(paths: List,
     :param max_tries: The maximum number of tries to create a node with a
                       unique name.
     """
+    # nodes are keyed by (id of parent node, name in path), which identifies
+    # a path prefix without rebuilding a tuple of the whole prefix per step
     nodes = { }
     for p in paths:
         parent = None
-        path = []
         for n in p:
-            path.append(n)
-            path_tuple = tuple(path)
-            name = n
-            if path_tuple not in nodes:
+            key = (id(parent), n)
+            if key not in nodes:
+                name = n
                 for tries in range(max_tries):
                     try:
                         new_node = type(name=name, parent=parent)
@@ -708,11 +774,10 @@ def paths_to_tree(paths: List,
                     except KeyError as e:
                         pass
                     name = f"{n}_{tries}"
-
-                if tries == max_tries:
+                else:
                     raise ValueError(f"Failed to create node with prefix {n}.")
-                nodes[path_tuple] = new_node
-            parent = nodes[path_tuple]
+                nodes[key] = new_node
+            parent = nodes[key]
     return parent.root
 
 def is_isomorphic(node1, node2):
@@ -736,9 +801,36 @@ def is_isomorphic(node1, node2):
     if not hasattr(node1, "children") or not hasattr(node2, "children"):
         raise ValueError("Nodes must have 'children' property")
 
-    if len(node1.children) != len(node2.children):
-        return False
-    for child1 in node1.children:
-        if not any(is_isomorphic(child1, child2) for child2 in node2.children):
-            return False
-    return True
\ No newline at end of file
+    # AHU canonization: both trees share one table of codes, so the trees
+    # are isomorphic iff their roots are assigned the same code.
+    codes = {}
+    return _ahu_code(node1, codes) == _ahu_code(node2, codes)
+
+def _ahu_code(node: Any, codes: dict) -> int:
+    """
+    Compute the AHU (Aho-Hopcroft-Ullman) code of a (sub)tree. Each
+    distinct sorted tuple of child codes is assigned a small integer in
+    `codes`, so two subtrees canonized against the same table get the same
+    code iff they are isomorphic.
+
+    :param node: The root node of the (sub)tree.
+    :param codes: Table of child-code signatures to integer codes.
+    :return: The code of the (sub)tree.
+    """
+    results = []
+    stack = [(node, None)]
+    while stack:
+        cur, n = stack.pop()
+        if n is None:
+            children = cur.children
+            stack.append((cur, len(children)))
+            stack.extend((child, None) for child in children)
+        else:
+            i = len(results) - n
+            sig = tuple(sorted(results[i:]))
+            del results[i:]
+            code = codes.get(sig)
+            if code is None:
+                code = codes[sig] = len(codes)
+            results.append(code)
+    return results[0]
\ No newline at end of file
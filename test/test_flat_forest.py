@@ -36,6 +36,14 @@ class TestFlatTree(unittest.TestCase):
         self.assertEqual(self.flat_tree.child_names("a"), ["b", "c"])
         self.assertEqual(self.flat_tree.child_names("b"), ["d", "e"])
         self.assertEqual(self.flat_tree.child_names("c"), ["f"])
+        self.assertEqual(self.flat_tree.child_names(FlatForest.DETACHED_KEY), [])
+        with self.assertRaises(KeyError):
+            self.flat_tree.child_names("z")
+        with self.assertRaises(KeyError):
+            self.flat_tree.child_names(None)
+        self.flat_tree.detach("b")
+        self.assertEqual(self.flat_tree.child_names(FlatForest.DETACHED_KEY), ["b"])
+        self.assertEqual(FlatForest({"x": {"parent": "y"}}).child_names("y"), ["x"])
 
     def test_detach(self):
         detached_node = self.flat_tree.detach("b")
@@ -69,6 +77,20 @@ class TestFlatTree(unittest.TestCase):
         with self.assertRaises(KeyError):
             FlatForest.check_valid(self.flat_tree)
 
+    def test_check_valid_detached_and_deep(self):
+        # nodes below a detached node are valid
+        self.flat_tree.detach("b")
+        FlatForest.check_valid(self.flat_tree)
+
+        # a long parent chain is checked without recursion
+        chain = {"n0": {"parent": None}}
+        for i in range(1, 5000):
+            chain[f"n{i}"] = {"parent": f"n{i - 1}"}
+        FlatForest.check_valid(chain)
+        chain["n0"]["parent"] = "n4999"
+        with self.assertRaises(ValueError):
+            FlatForest.check_valid(chain)
+
     def test_node(self):
         node_b = self.flat_tree.node("b")
         self.assertEqual(node_b._key, "b")
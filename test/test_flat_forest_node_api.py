@@ -90,6 +90,24 @@ class TestFlatTreeNodeAPI(unittest.TestCase):
         node3.children = []
         self.assertEqual(node3.children, [])
 
+    def test_contains(self):
+        node1 = self.root.add_child(name="node1", data=1)
+        node1.add_child(name="node2", data=2)
+        self.root.add_child(name="node3", data=3)
+
+        self.assertTrue(self.root.contains("node2"))
+        self.assertTrue(self.root.contains("root"))
+        self.assertTrue(node1.contains("node2"))
+        self.assertFalse(node1.contains("node3"))
+        self.assertFalse(self.root.contains("missing"))
+        self.assertTrue(self.tree.contains("node2"))
+
+        # nodes under a detached node are only in the detached subtree
+        node1.detach()
+        self.assertFalse(self.root.contains("node2"))
+        self.assertTrue(self.tree.detached.contains("node2"))
+        self.assertFalse(self.tree.detached.contains("node3"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,7 +17,9 @@ from AlgoTree.utils import (
     map,
     siblings,
     visit,
-    size
+    size,
+    subtree_centered_at,
+    subtree_rooted_at,
 )
 
 
@@ -157,6 +159,20 @@ class TestTreeUtils(unittest.TestCase):
             print(n)
         self.assertCountEqual(subtree.children, true_childs)
 
+    def test_subtree_rooted_at(self):
+        sub = subtree_rooted_at(self.node3, 1)
+        self.assertEqual(sub.name, "node3")
+        self.assertCountEqual(
+            [n.name for n in sub.children],
+            ["node4", "node5", "node6", "node7", "node8"])
+        self.assertEqual(size(sub), 6)
+
+    def test_subtree_centered_at(self):
+        sub = subtree_centered_at(self.node9, 2)
+        self.assertEqual(sub.name, "node3")
+        self.assertEqual([n.name for n in sub.children], ["node6"])
+        self.assertEqual([n.name for n in sub.children[0].children], ["node9"])
+
     def test_siblings(self):
         self.assertEqual(siblings(self.node6), [self.node4, self.node5, self.node7, self.node8])
 
@@ -3,11 +3,30 @@ import time
 import unittest
 
 from AlgoTree.treenode import TreeNode
-from AlgoTree.utils import visit
+from AlgoTree.utils import depth, size, visit
 
 logging.basicConfig(level=logging.DEBUG)
 
 
+def make_balanced_tree(levels, fanout):
+    """
+    Build a balanced tree level by level.
+
+    :param levels: The number of levels below the root.
+    :param fanout: The number of children of each internal node.
+    :return: The root node and the list of nodes on the deepest level.
+    """
+    root = TreeNode(name="large_root")
+    current_level = [root]
+    for _ in range(levels):
+        next_level = []
+        for node in current_level:
+            for i in range(fanout):
+                next_level.append(TreeNode(name=f"node_{i}", parent=node))
+        current_level = next_level
+    return root, current_level
+
+
 class TestTreeNodeAdvanced(unittest.TestCase):
     def setUp(self):
         """
@@ -43,14 +62,7 @@ class TestTreeNodeAdvanced(unittest.TestCase):
 
     def test_large_tree_performance(self):
         # Create a large tree
-        large_root = TreeNode(name="large_root")
-        current_level = [large_root]
-        for _ in range(5):  # Adjust depth as needed
-            next_level = []
-            for node in current_level:
-                for i in range(10):  # Adjust branching factor as needed
-                    next_level.append(TreeNode(name=f"node_{i}", parent=node))
-            current_level = next_level
+        large_root, _ = make_balanced_tree(levels=5, fanout=10)
 
         # Measure traversal time
         start_time = time.time()
@@ -60,6 +72,16 @@ class TestTreeNodeAdvanced(unittest.TestCase):
         # Assert traversal time is within acceptable limits (e.g., 1 second)
         self.assertLess(traversal_time, 1)
 
+    def test_large_tree_size_and_depth_performance(self):
+        large_root, deepest = make_balanced_tree(levels=5, fanout=10)
+
+        start_time = time.time()
+        self.assertEqual(size(large_root), 111111)
+        self.assertEqual(depth(deepest[-1]), 5)
+        elapsed = time.time() - start_time
+
+        self.assertLess(elapsed, 1)
+
     def test_edge_cases(self):
         empty_tree = TreeNode()
         single_node_tree = TreeNode(name="single")
@@ -5,7 +5,8 @@ from AlgoTree.flat_forest_node import FlatForestNode
 from AlgoTree.node_hasher import NodeHasher
 
 class TestNodeHash(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Create a sample tree for testing
 
@@ -23,19 +24,19 @@ class TestNodeHash(unittest.TestCase):
                 |
                 +-- c
         """
-        self.node_a = FlatForestNode(name="a", data1=1, data2=2)
-        self.node_b = FlatForestNode(name="b", parent=self.node_a, data="test")
-        self.node_c = FlatForestNode(name="c", parent=self.node_a, different_data="test2")
-        self.node_d = FlatForestNode(name="d", parent=self.node_b, data="test")
-        self.node_e = FlatForestNode(name="e", parent=self.node_b, different_data="test2")
-        self.node_f = FlatForestNode(name="f", parent=self.node_d, data="test")
-
-        self.tree_node_a = TreeNode(name="a", data1=1, data2=2)
-        self.tree_node_b = TreeNode(name="b", parent=self.tree_node_a, data="test")
-        self.tree_node_c = TreeNode(name="c", parent=self.tree_node_a, different_data="test2")
-        self.tree_node_d = TreeNode(name="d", parent=self.tree_node_b, data="test")
-        self.tree_node_e = TreeNode(name="e", parent=self.tree_node_b, different_data="test2")
-        self.tree_node_f = TreeNode(name="f", parent=self.tree_node_d, data="test")
+        cls.node_a = FlatForestNode(name="a", data1=1, data2=2)
+        cls.node_b = FlatForestNode(name="b", parent=cls.node_a, data="test")
+        cls.node_c = FlatForestNode(name="c", parent=cls.node_a, different_data="test2")
+        cls.node_d = FlatForestNode(name="d", parent=cls.node_b, data="test")
+        cls.node_e = FlatForestNode(name="e", parent=cls.node_b, different_data="test2")
+        cls.node_f = FlatForestNode(name="f", parent=cls.node_d, data="test")
+
+        cls.tree_node_a = TreeNode(name="a", data1=1, data2=2)
+        cls.tree_node_b = TreeNode(name="b", parent=cls.tree_node_a, data="test")
+        cls.tree_node_c = TreeNode(name="c", parent=cls.tree_node_a, different_data="test2")
+        cls.tree_node_d = TreeNode(name="d", parent=cls.tree_node_b, data="test")
+        cls.tree_node_e = TreeNode(name="e", parent=cls.tree_node_b, different_data="test2")
+        cls.tree_node_f = TreeNode(name="f", parent=cls.tree_node_d, data="test")
 
     def test_name_hash(self):
         # Test that the name hash of two nodes with different names is not the same
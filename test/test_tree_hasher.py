@@ -15,37 +15,39 @@ class Node:
 
 class TestTreeHasher(unittest.TestCase):
 
-    def setUp(self):
-        # Create some example trees for testing
-        self.tree1 = Node('Root')
+    @classmethod
+    def setUpClass(cls):
+        # Create some example trees for testing; the tests only read them,
+        # so they are shared by all tests in the class
+        cls.tree1 = Node('Root')
         child1_1 = Node('A', payload=10)
         child1_2 = Node('B', payload=20)
-        self.tree1.add_child(child1_1)
-        self.tree1.add_child(child1_2)
+        cls.tree1.add_child(child1_1)
+        cls.tree1.add_child(child1_2)
 
-        self.tree2 = Node('Root')
+        cls.tree2 = Node('Root')
         child2_1 = Node('A', payload=10)
         child2_2 = Node('B', payload=20)
-        self.tree2.add_child(child2_1)
-        self.tree2.add_child(child2_2)
+        cls.tree2.add_child(child2_1)
+        cls.tree2.add_child(child2_2)
 
-        self.tree3 = Node('Root')
+        cls.tree3 = Node('Root')
         child3_1 = Node('A', payload=10)
         child3_2 = Node('C', payload=30)  # Different payload and name
-        self.tree3.add_child(child3_1)
-        self.tree3.add_child(child3_2)
+        cls.tree3.add_child(child3_1)
+        cls.tree3.add_child(child3_2)
 
-        self.tree4 = TreeNode(name='Root', payload=None)
-        TreeNode(name='A', payload=10, parent=self.tree4)
-        TreeNode(name='B', payload=20, parent=self.tree4)
+        cls.tree4 = TreeNode(name='Root', payload=None)
+        TreeNode(name='A', payload=10, parent=cls.tree4)
+        TreeNode(name='B', payload=20, parent=cls.tree4)
 
 
-        self.non_iso_tree = TreeNode(name='Root', payload=None)
-        nodeAnoniso = TreeNode(name='A', payload=10, parent=self.non_iso_tree)
+        cls.non_iso_tree = TreeNode(name='Root', payload=None)
+        nodeAnoniso = TreeNode(name='A', payload=10, parent=cls.non_iso_tree)
         TreeNode(name='B', payload=20, parent=nodeAnoniso)
 
 
-        self.tree_hasher = TreeHasher()
+        cls.tree_hasher = TreeHasher()
 
     def test_tree_hash_equal_trees(self):
         """Test that two identical trees have the same hash."""
@@ -92,5 +94,16 @@ class TestTreeHasher(unittest.TestCase):
         single_node_tree = Node('Single', payload=42)
         self.assertIsInstance(self.tree_hasher(single_node_tree), int)
 
+    def test_tree_hash_deep_tree(self):
+        """Test that hashing a very deep tree does not hit the recursion limit."""
+        root = Node('0')
+        node = root
+        for i in range(1, 5000):
+            child = Node(str(i))
+            node.add_child(child)
+            node = child
+        self.assertIsInstance(self.tree_hasher(root), int)
+        self.assertIsInstance(TreeHasher.isomorphic(root), int)
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,15 +19,17 @@ class TestTreePrettyPrinter(unittest.TestCase):
                 node = node.parent
             return node
     
-    def setUp(self):
-        # Creating a sample tree structure for testing
-        self.root = self.Node('root', [
-            self.Node('child1', [
-                self.Node('child1.1'),
-                self.Node('child1.2')
+    @classmethod
+    def setUpClass(cls):
+        # Creating a sample tree structure for testing; the printer only
+        # reads it, so it is shared by all tests in the class
+        cls.root = cls.Node('root', [
+            cls.Node('child1', [
+                cls.Node('child1.1'),
+                cls.Node('child1.2')
             ]),
-            self.Node('child2', [
-                self.Node('child2.1')
+            cls.Node('child2', [
+                cls.Node('child2.1')
             ])
         ])
     
@@ -57,5 +59,17 @@ class TestTreePrettyPrinter(unittest.TestCase):
         )
         self.assertEqual(out, expected_output, msg="Marked nodes are not displayed correctly")
 
+    def test_deep_tree(self):
+        # deeper than the default recursion limit
+        node = self.Node('n1499')
+        for i in range(1498, -1, -1):
+            node = self.Node(f'n{i}', [node])
+        out = PrettyTree(indent=2)(node)
+        lines = out.splitlines()
+        self.assertEqual(len(lines), 1500)
+        self.assertEqual(lines[0], "n0")
+        self.assertEqual(lines[2], "  └ n2")
+        self.assertEqual(lines[-1], "  " * 1498 + "└ n1499")
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,19 @@ class TestTreeNode(unittest.TestCase):
         self.assertEqual(node.payload["value"], 10)
         self.assertEqual(node.children, [])
 
+    def test_constructor_with_str_subclass_name(self):
+        class Name(str):
+            pass
+
+        node = TreeNode(name=Name("root"), value=10)
+        self.assertEqual(node.name, "root")
+        self.assertIsInstance(node.name, Name)
+
+    def test_weakref(self):
+        import weakref
+        node = TreeNode(name="root")
+        self.assertIs(weakref.ref(node)(), node)
+
     def test_add_child(self):
         root = TreeNode(name="root", value=10)
         child = root.add_child(name="child1", value=1)
@@ -9,12 +9,15 @@ from AlgoTree.utils import (
     find_node,
     find_nodes,
     height,
+    is_ancestor,
     is_internal,
+    is_isomorphic,
     is_leaf,
     is_root,
     leaves,
     map,
     siblings,
+    size,
     visit,
 )
 
@@ -118,6 +121,28 @@ class TestTreeNodeUtils(unittest.TestCase):
         self.assertEqual(self.node1.payload["value"], 2)
         self.assertEqual(self.node9.payload["value"], 10)
 
+    def test_map_deep(self):
+        # deeper than the default recursion limit
+        node = self.node9
+        for i in range(5000):
+            node = TreeNode(name=f"deep{i}", parent=node, value=0)
+        map(self.node0, lambda n: None if n is node else n)
+        self.assertEqual(node.parent.children, [])
+        self.assertEqual(depth(node.parent), 5002)
+
+    def test_from_dict_deep(self):
+        # deeper than the default recursion limit
+        node = self.node9
+        for i in range(5000):
+            node = TreeNode(name=f"deep{i}", parent=node, value=i)
+        data = self.node0.to_dict()
+        copy = TreeNode.from_dict(data)
+        self.assertEqual(size(copy), size(self.node0))
+        deepest = copy.node("deep4999")
+        self.assertEqual(depth(deepest), 5003)
+        self.assertEqual(deepest.payload, {"value": 4999})
+        self.assertEqual(data["name"], "node0")
+
     def test_descendants_node3(self):
         self.assertCountEqual(
             descendants(self.node3),
@@ -127,6 +152,51 @@ class TestTreeNodeUtils(unittest.TestCase):
     def test_ancestors_node9(self):
         self.assertCountEqual(ancestors(self.node9), [self.node6, self.node3, self.node0])
 
+    def test_ancestors_deep(self):
+        # deeper than the default recursion limit
+        node = self.node9
+        for i in range(5000):
+            node = TreeNode(name=f"deep{i}", parent=node)
+        anc = ancestors(node)
+        self.assertEqual(len(anc), 5003)
+        self.assertIs(anc[0], node.parent)
+        self.assertIs(anc[-1], self.node0)
+
+    def test_is_ancestor(self):
+        self.assertTrue(is_ancestor(self.node0, self.node9))
+        self.assertTrue(is_ancestor(self.node6, self.node9))
+        self.assertFalse(is_ancestor(self.node9, self.node6))
+        self.assertFalse(is_ancestor(self.node1, self.node9))
+        self.assertFalse(is_ancestor(self.node9, self.node9))
+
+    def test_contains(self):
+        self.assertTrue(self.node3.contains("node9"))
+        self.assertTrue(self.node3.contains("node3"))
+        self.assertFalse(self.node3.contains("node1"))
+
+    def test_is_isomorphic(self):
+        other = TreeNode(name="a")
+        b = TreeNode(name="b", parent=other)
+        TreeNode(name="c", parent=other)
+        TreeNode(name="d", parent=b)
+        self.assertTrue(is_isomorphic(self.node3, self.node3))
+        self.assertTrue(is_isomorphic(self.node6, TreeNode(name="x", parent=TreeNode(name="y")).parent))
+        self.assertFalse(is_isomorphic(self.node0, self.node3))
+
+        # same number of children, and each child of one tree matches some
+        # child of the other, but the multisets of children differ
+        t1 = TreeNode(name="t1")
+        TreeNode(name="t1a", parent=TreeNode(name="t1x", parent=t1))
+        TreeNode(name="t1b", parent=TreeNode(name="t1y", parent=t1))
+        TreeNode(name="t1z", parent=t1)
+        t2 = TreeNode(name="t2")
+        TreeNode(name="t2a", parent=TreeNode(name="t2x", parent=t2))
+        TreeNode(name="t2y", parent=t2)
+        TreeNode(name="t2z", parent=t2)
+        self.assertFalse(is_isomorphic(t1, t2))
+        self.assertTrue(is_isomorphic(other, TreeNode.from_dict(
+            {"name": "r", "children": [{"name": "s"}, {"name": "t", "children": [{"name": "u"}]}]})))
+
     def test_siblings_node6(self):
         from AlgoTree.pretty_tree import pretty_tree
         print(pretty_tree(self.node0.node("node6")))